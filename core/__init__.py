@@ -13,6 +13,11 @@ from .engine import VisiontegralEngine, IntegrationResult, VisiontegralError
 from .manifolds import HyperSphere, HyperRectangle, BaseManifold
 from .monte_carlo import MonteCarloSolver
 from .quadratures import AdaptiveQuadratureSolver
+from .multilevel import MultilevelMonteCarloSolver
+from .projections import MarginalProjector
+from .transforms import DomainTransform
+from .selection import MethodSelector, ProbeReport
+from .contours import ContourIntegrator, ContourPath, Segment, Arc, Circle, Polyline
 
 # Defining what gets exported when someone does 'from core import *'
 __all__ = [
@@ -21,6 +26,17 @@ __all__ = [
     "VisiontegralError",
     "MonteCarloSolver",
     "AdaptiveQuadratureSolver",
+    "MultilevelMonteCarloSolver",
+    "MarginalProjector",
+    "DomainTransform",
+    "MethodSelector",
+    "ProbeReport",
+    "ContourIntegrator",
+    "ContourPath",
+    "Segment",
+    "Arc",
+    "Circle",
+    "Polyline",
     "HyperSphere",
     "HyperRectangle",
     "BaseManifold"
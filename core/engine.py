@@ -4,22 +4,26 @@ Author: Visionis
 Description: Orchestrates different solvers and manages the integration pipeline.
 """
 
+import inspect
 import logging
 import time
+import numpy as np
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Callable, List, Tuple, Optional, Dict, Type
+from typing import Callable, List, Tuple, Optional, Dict, Type, Union
 
 # --- Core Data Structures ---
 
 @dataclass(frozen=True)
 class IntegrationResult:
     """Immutable container for finalized integration data."""
-    value: float
+    value: Union[float, complex]
     error_estimate: float
     dimension: int
     samples: int
     execution_time: float = 0.0
+    method: Optional[str] = None
+    selection_reason: Optional[str] = None
 
     def __repr__(self) -> str:
         return f"<VisiontegralResult: {self.value:.6f} ± {self.error_estimate:.6e}>"
@@ -41,26 +45,42 @@ class BaseIntegrator(ABC):
 class VisiontegralEngine:
     """
     The High-Level API. Users interact only with this class.
-    It delegates tasks to specialized solvers in monte_carlo.py or quadratures.py.
+    It delegates tasks to specialized solvers in monte_carlo.py, quadratures.py
+    or multilevel.py.
     """
     def __init__(self):
         # We store references to our specialized solvers
         from .monte_carlo import MonteCarloSolver
         from .quadratures import AdaptiveQuadratureSolver
+        from .multilevel import MultilevelMonteCarloSolver
+        from .selection import MethodSelector
         
         self._solvers: Dict[str, BaseIntegrator] = {
             "monte_carlo": MonteCarloSolver(),
-            "quadrature": AdaptiveQuadratureSolver()
+            "quadrature": AdaptiveQuadratureSolver(),
+            "tanh_sinh": AdaptiveQuadratureSolver(method="tanh_sinh"),
+            "multilevel": MultilevelMonteCarloSolver()
         }
+        self.selector = MethodSelector()
         self.logger = logging.getLogger("VisiontegralEngine")
 
     def run(self, 
             func: Callable, 
             bounds: List[Tuple[float, float]], 
             method: str = "monte_carlo", 
+            transform: str = "rational",
+            transform_scale: float = 1.0,
+            transform_center: float = 0.0,
+            tolerance: Optional[float] = None,
+            time_budget: Optional[float] = None,
             **kwargs) -> IntegrationResult:
         """
         Validates inputs and executes the requested integration method.
+        Infinite bounds are mapped onto a finite box using `transform`
+        ("rational" or "gaussian"), with the Jacobian folded into the integrand;
+        `transform_scale` and `transform_center` place the map on the integrand's bulk.
+        With method="auto", a short probe of the integrand picks the solver;
+        `tolerance` (absolute) and `time_budget` (seconds) steer that choice.
         """
         # 1. Validation
         if not callable(func):
@@ -70,19 +90,107 @@ class VisiontegralEngine:
         if bounds_arr.ndim != 2 or bounds_arr.shape[1] != 2:
             raise VisiontegralError("Bounds must be a list of (min, max) tuples.")
 
+        if method.lower() == "auto" and self._takes_level(func):
+            raise VisiontegralError(
+                "method='auto' probes func(points) and cannot drive multilevel integrands "
+                "func(points, level); use method='multilevel' instead."
+            )
+
+        if not np.all(np.isfinite(bounds_arr)):
+            from .transforms import DomainTransform
+            domain = DomainTransform(bounds_arr, scheme=transform, scale=transform_scale,
+                                     center=transform_center)
+            func, bounds_arr = domain.wrap(func), domain.finite_bounds
+
+            # Sampling-side helpers must live in the same t-space as the wrapped integrand
+            if kwargs.get("control_variate") is not None:
+                kwargs["control_variate"] = domain.wrap(kwargs["control_variate"])
+            if kwargs.get("projector") is not None:
+                raise VisiontegralError("A MarginalProjector cannot be combined with infinite bounds.")
+
         # 2. Solver Selection
-        solver = self._solvers.get(method.lower())
+        method = method.lower()
+        reason = None
+        probe_evals = 0
+        # The probe is part of the cost of method="auto", so the clock starts before it
+        start_t = time.perf_counter()
+        if method == "auto":
+            method, reason, probe_evals = self._select_method(func, bounds_arr, tolerance, time_budget, kwargs)
+            self.logger.info(f"Auto-selected '{method}': {reason}")
+
+        solver = self._solvers.get(method)
         if not solver:
             raise VisiontegralError(f"Method '{method}' is not implemented. Available: {list(self._solvers.keys())}")
 
+        # Deterministic solvers take the tolerance as their stopping criterion
+        if (reason is not None and tolerance is not None and "epsabs" not in kwargs
+                and "epsabs" in inspect.signature(solver.integrate).parameters):
+            kwargs["epsabs"] = tolerance
+
         # 3. Execution & Performance Tracking
         self.logger.info(f"Execution started using {method} for {len(bounds)}D space.")
         
-        start_t = time.perf_counter()
         result = solver.integrate(func, bounds_arr, **kwargs)
         elapsed = time.perf_counter() - start_t
+
+        if reason is not None and tolerance is not None and result.error_estimate > tolerance:
+            reason += f"; error estimate {result.error_estimate:.3g} misses the tolerance {tolerance:.3g}"
+            self.logger.warning(f"Auto-selected '{method}' did not reach the tolerance: {reason}")
         
         # Inject execution time into the immutable result via object.__setattr__
         object.__setattr__(result, 'execution_time', elapsed)
+        object.__setattr__(result, 'samples', result.samples + probe_evals)
+        object.__setattr__(result, 'method', method)
+        object.__setattr__(result, 'selection_reason', reason)
         
         return result
+
+    def contour(self,
+                func: Callable,
+                path: "ContourPath",
+                **kwargs) -> Union[IntegrationResult, List[IntegrationResult]]:
+        """
+        Integrates a complex function f(z) dz along a parametrized path.
+        A path built from array parameters (e.g. Circle(centers, r)) describes
+        a family of contours; one result per contour is returned in that case.
+        kwargs configure the ContourIntegrator (order, epsabs, ...).
+        """
+        from .contours import ContourIntegrator
+
+        if not callable(func):
+            raise VisiontegralError("Provided function is not callable.")
+
+        self.logger.info(f"Contour integration started over {path.count} path(s).")
+        integrator = ContourIntegrator(**kwargs)
+        if path.count == 1:
+            return integrator.integrate(func, path)
+        return integrator.integrate_batch(func, path)
+
+    def _select_method(self,
+                       func: Callable,
+                       bounds: np.ndarray,
+                       tolerance: Optional[float],
+                       time_budget: Optional[float],
+                       solver_kwargs: Dict) -> Tuple[str, str, int]:
+        """
+        Probes the integrand and picks among solvers that accept the given kwargs.
+        :return: (method name, reason, probe evaluations)
+        """
+        candidates = {
+            name: solver for name, solver in self._solvers.items()
+            if name != "multilevel"  # Needs func(points, level); never a probe-driven choice
+            and set(solver_kwargs) <= set(inspect.signature(solver.integrate).parameters)
+        }
+        report = self.selector.probe(func, bounds)
+        method, reason = self.selector.select(report, candidates, bounds, tolerance, time_budget)
+        return method, f"{reason}; probe used {report.evaluations} evaluations", report.evaluations
+
+    @staticmethod
+    def _takes_level(func: Callable) -> bool:
+        """True if func requires a second positional argument, i.e. the MLMC func(points, level) form."""
+        try:
+            params = inspect.signature(func).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        return sum(p.kind in positional and p.default is p.empty for p in params) >= 2
@@ -6,8 +6,9 @@ Description: High-performance Monte Carlo integration algorithms.
 
 import numpy as np
 import logging
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 from .engine import BaseIntegrator, IntegrationResult, VisiontegralError
+from .projections import MarginalProjector
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +16,66 @@ class MonteCarloSolver(BaseIntegrator):
     """
     Standard Monte Carlo Estimator with Batch Processing.
     Suitable for high-dimensional integration (Dims > 3).
+
+    Variance reduction:
+      - antithetic=True pairs every uniform draw u with 1 - u inside a batch.
+      - control_variate/control_integral passed to integrate() subtract a
+        correlated function with a known integral, using the optimal
+        coefficient estimated from the running batch statistics.
     """
-    def __init__(self, samples: int = 1_000_000, batch_size: int = 500_000, seed: Optional[int] = None):
+    def __init__(self, samples: int = 1_000_000, batch_size: int = 500_000, seed: Optional[int] = None,
+                 antithetic: bool = False):
         self.samples = samples
         self.batch_size = batch_size
         self.rng = np.random.default_rng(seed)  # Modern numpy random generator
+        self.antithetic = antithetic
 
-    def integrate(self, func: Callable, bounds: np.ndarray) -> IntegrationResult:
+    def integrate(self, func: Callable, bounds: np.ndarray,
+                  projector: Optional[MarginalProjector] = None,
+                  control_variate: Optional[Callable] = None,
+                  control_integral: Optional[Union[float, np.ndarray]] = None) -> IntegrationResult:
+        """
+        :param projector: Optional marginal accumulator fed with every evaluated batch.
+        :param control_variate: Vectorized g(points) returning (N,) or (N, K) values.
+        :param control_integral: Exact integral of g over bounds, scalar or (K,).
+        """
         dim = len(bounds)
         volume_hypercube = np.prod(bounds[:, 1] - bounds[:, 0])
-        
+
+        if projector is not None and (projector.dimension != dim
+                                      or not np.allclose(projector.bounds, bounds)):
+            raise VisiontegralError(
+                f"Projector bounds {projector.bounds.tolist()} do not match the integration bounds {bounds.tolist()}."
+            )
+        if (control_variate is None) != (control_integral is None):
+            raise VisiontegralError("control_variate and control_integral must be given together.")
+        n_controls = 0 if control_integral is None else np.size(control_integral)
+
+        # Running sums over independent units (single draws, or antithetic pairs)
         total_sum = 0.0
         total_sq_sum = 0.0
+        g_sum = np.zeros(n_controls)
+        gg_sum = np.zeros((n_controls, n_controls))
+        gf_sum = np.zeros(n_controls)
+        units = 0
         processed = 0
 
+        # Antithetic batches are kept even so that only a final odd sample goes unpaired
+        batch_size = self.batch_size
+        if self.antithetic and batch_size > 1:
+            batch_size -= batch_size % 2
+
         # Process in batches to maintain low memory footprint
         while processed < self.samples:
-            current_batch = min(self.batch_size, self.samples - processed)
+            current_batch = min(batch_size, self.samples - processed)
             
             # Generate random points within bounds
             # Formula: min + (max-min) * random[0,1]
-            random_raw = self.rng.random((current_batch, dim))
+            if self.antithetic:
+                half = self.rng.random((current_batch // 2, dim))
+                random_raw = np.concatenate([half, 1.0 - half, self.rng.random((current_batch % 2, dim))])
+            else:
+                random_raw = self.rng.random((current_batch, dim))
             points = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * random_raw
             
             try:
@@ -46,26 +86,60 @@ class MonteCarloSolver(BaseIntegrator):
                      logger.warning("Non-finite values detected in integration stream.")
                      values = np.nan_to_num(values) # Sanitize
 
-                total_sum += np.sum(values)
-                total_sq_sum += np.sum(values ** 2)
+                if n_controls:
+                    controls = np.asarray(control_variate(points), dtype=np.float64).reshape(len(points), n_controls)
                 
             except Exception as e:
                 raise VisiontegralError(f"Function evaluation failed during Monte Carlo: {e}")
 
-            processed += current_batch
+            # Reuse the evaluated batch for visualization; no extra function calls
+            if projector is not None:
+                projector.accumulate(points, values)
+
+            # Antithetic pairs are averaged into one unit so the error estimate sees their correlation;
+            # an unpaired last sample is a unit of its own
+            unit_values = values
+            if self.antithetic:
+                n_pairs = len(values) // 2
+                unit_values = np.concatenate([0.5 * (values[:n_pairs] + values[n_pairs:2 * n_pairs]),
+                                              values[2 * n_pairs:]])
+                if n_controls:
+                    controls = np.concatenate([0.5 * (controls[:n_pairs] + controls[n_pairs:2 * n_pairs]),
+                                               controls[2 * n_pairs:]])
+
+            total_sum += np.sum(unit_values)
+            total_sq_sum += np.sum(np.abs(unit_values) ** 2)  # |f|^2 keeps complex integrands exact
+            if n_controls:
+                g_sum += controls.sum(axis=0)
+                gg_sum += controls.T @ controls
+                gf_sum = gf_sum + controls.T @ unit_values  # Promotes to complex when f is complex
+
+            units += len(unit_values)
+            processed += len(values)
 
         # Final Statistics
-        mean = total_sum / self.samples
-        variance = (total_sq_sum / self.samples) - (mean ** 2)
+        mean = total_sum / units
+        variance = (total_sq_sum / units) - abs(mean) ** 2
+
+        if n_controls:
+            # Optimal coefficient beta = Cov(g, g)^-1 Cov(g, f) from the accumulated moments
+            g_mean = g_sum / units
+            cov_gg = gg_sum / units - np.outer(g_mean, g_mean)
+            cov_gf = gf_sum / units - g_mean * mean
+            beta = np.linalg.lstsq(cov_gg, cov_gf, rcond=None)[0]
+
+            g_exact_mean = np.ravel(control_integral) / volume_hypercube
+            mean = mean - beta @ (g_mean - g_exact_mean)
+            variance = max(variance - 2 * np.real(np.conj(beta) @ cov_gf)
+                           + np.real(np.conj(beta) @ cov_gg @ beta), 0.0)
         
         # Standard Error of the Mean (SEM)
-        std_error = volume_hypercube * np.sqrt(variance / self.samples)
+        std_error = volume_hypercube * np.sqrt(variance / units)
         integral_result = volume_hypercube * mean
         
         return IntegrationResult(
             value=integral_result,
             error_estimate=std_error,
             dimension=dim,
-            samples=self.samples
+            samples=processed
         )
-
@@ -0,0 +1,159 @@
+"""
+multilevel.py - Multilevel Monte Carlo Integration
+Author: Visionis
+Description: MLMC for integrands with a tunable fidelity knob, func(points, level).
+             Combines cheap coarse levels with correlated fine-level corrections.
+"""
+
+import numpy as np
+import logging
+import time
+from typing import Callable, List, Optional
+from .engine import BaseIntegrator, IntegrationResult, VisiontegralError
+
+logger = logging.getLogger(__name__)
+
+class _LevelStats:
+    """Running sums of the level correction Y_l = f_l - f_{l-1} and its cost."""
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.sq_total = 0.0
+        self.seconds = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    @property
+    def variance(self) -> float:
+        return max(self.sq_total / self.count - abs(self.mean) ** 2, 0.0)
+
+    @property
+    def cost(self) -> float:
+        """Measured wall time per sample at this level."""
+        return self.seconds / self.count
+
+class MultilevelMonteCarloSolver(BaseIntegrator):
+    """
+    Multilevel Monte Carlo (Giles' adaptive algorithm).
+    The telescoping sum E[f_L] = E[f_0] + sum_l E[f_l - f_{l-1}] is estimated
+    level by level, evaluating f_l and f_{l-1} on the same points so the
+    corrections have small variance. Per-level variance and cost are measured
+    on the fly and drive the optimal sample allocation.
+
+    func is called as func(points, level) with points of shape (N, D).
+    """
+    def __init__(self,
+                 epsilon: float = 1e-3,
+                 min_level: int = 2,
+                 max_level: int = 10,
+                 initial_samples: int = 1_000,
+                 batch_size: int = 500_000,
+                 seed: Optional[int] = None):
+        # The bias test extrapolates from the level corrections, so at least one is required
+        if min_level < 1:
+            raise VisiontegralError(f"min_level must be >= 1 for the MLMC bias estimate, got {min_level}.")
+        if max_level < min_level:
+            raise VisiontegralError(f"max_level ({max_level}) must be >= min_level ({min_level}).")
+        self.epsilon = epsilon                   # Target root-mean-square error of the integral
+        self.min_level = min_level               # Levels used before the bias test kicks in
+        self.max_level = max_level
+        self.initial_samples = initial_samples   # Pilot samples on a newly added level
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+
+    def integrate(self, func: Callable, bounds: np.ndarray, epsilon: Optional[float] = None) -> IntegrationResult:
+        """
+        :param epsilon: Overrides the solver's target RMSE for this call.
+        """
+        dim = len(bounds)
+        volume = np.prod(bounds[:, 1] - bounds[:, 0])
+        # Work in terms of the mean; the integral is volume * mean
+        eps = (self.epsilon if epsilon is None else epsilon) / volume
+
+        levels: List[_LevelStats] = []
+        planned: List[int] = []
+        for _ in range(self.min_level + 1):
+            levels.append(_LevelStats())
+            planned.append(self.initial_samples)
+
+        while True:
+            # 1. Top up every level to its planned sample count
+            for level, stats in enumerate(levels):
+                extra = planned[level] - stats.count
+                if extra > 0:
+                    self._sample_level(func, bounds, level, extra, stats)
+
+            # 2. Optimal allocation N_l ~ sqrt(V_l / C_l) * sum_k sqrt(V_k C_k) / eps^2 for half the MSE
+            var = np.array([s.variance for s in levels])
+            cost = np.array([s.cost for s in levels])
+            weight = np.sum(np.sqrt(var * cost))
+            optimal = np.ceil(2.0 * np.sqrt(var / np.maximum(cost, 1e-300)) * weight / eps ** 2).astype(int)
+            planned = [max(p, int(n)) for p, n in zip(planned, optimal)]
+
+            if any(p > s.count for p, s in zip(planned, levels)):
+                continue
+
+            # 3. Bias test on the finest corrections; add a level if the bias budget is exceeded
+            bias = self._bias_estimate(levels)
+            if bias <= eps / np.sqrt(2.0):
+                break
+            if len(levels) > self.max_level:
+                logger.warning(f"MLMC reached max_level={self.max_level} with estimated bias {bias * volume:.3e}.")
+                break
+            levels.append(_LevelStats())
+            planned.append(self.initial_samples)
+
+        mean = sum(s.mean for s in levels)
+        stat_error = np.sqrt(sum(s.variance / s.count for s in levels))
+        bias = self._bias_estimate(levels)
+
+        return IntegrationResult(
+            value=volume * mean,
+            error_estimate=volume * np.sqrt(stat_error ** 2 + bias ** 2),
+            dimension=dim,
+            samples=sum(s.count for s in levels)
+        )
+
+    def _sample_level(self, func: Callable, bounds: np.ndarray, level: int, samples: int,
+                      stats: _LevelStats) -> None:
+        """Adds `samples` evaluations of Y_level, sharing points between the two fidelities."""
+        dim = len(bounds)
+        processed = 0
+
+        while processed < samples:
+            current_batch = min(self.batch_size, samples - processed)
+            points = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * self.rng.random((current_batch, dim))
+
+            start_t = time.perf_counter()
+            try:
+                values = np.asarray(func(points, level))
+                if level > 0:
+                    values = values - np.asarray(func(points, level - 1))
+            except Exception as e:
+                raise VisiontegralError(f"Function evaluation failed during MLMC at level {level}: {e}")
+            stats.seconds += time.perf_counter() - start_t
+
+            if not np.all(np.isfinite(values)):
+                logger.warning("Non-finite values detected in integration stream.")
+                values = np.nan_to_num(values)
+
+            stats.total += np.sum(values)
+            stats.sq_total += np.sum(np.abs(values) ** 2)
+            stats.count += current_batch
+            processed += current_batch
+
+    @staticmethod
+    def _bias_estimate(levels: List[_LevelStats]) -> float:
+        """
+        Remaining bias of the finest level, from the decay rate alpha of |E[Y_l]|
+        fitted over levels >= 1 (Giles' extrapolation).
+        """
+        means = np.array([abs(s.mean) for s in levels[1:]]) + 1e-300
+        if len(means) < 2:
+            return float(means[-1])
+
+        alpha = max(0.5, -np.polyfit(np.arange(1, len(levels)), np.log2(means), 1)[0])
+        factor = 2.0 ** alpha - 1.0
+        return float(max(means[-1] / factor, means[-2] / (2.0 ** alpha * factor)))
@@ -0,0 +1,155 @@
+"""
+projections.py - Streaming Marginal Projections
+Author: Visionis
+Description: Accumulates 1D and 2D marginal histograms of high-dimensional
+             integrands while a sampling solver runs, so renderers can draw
+             them without a second sampling pass.
+"""
+
+import itertools
+import numpy as np
+from typing import Callable, Iterable, List, Optional, Tuple
+from .engine import VisiontegralError
+
+class MarginalProjector:
+    """
+    Fixed-size, integrand-weighted marginal histograms fed batch by batch.
+    Every axis gets a 1D marginal; selected axis pairs get a 2D marginal.
+    """
+    def __init__(self,
+                 bounds: np.ndarray,
+                 bins: int = 64,
+                 pairs: Optional[Iterable[Tuple[int, int]]] = None):
+        """
+        :param bounds: (D, 2) array where [[min, max], ...]
+        :param bins: Number of bins per axis.
+        :param pairs: Axis pairs to project onto. Defaults to all pairs.
+        """
+        self.bounds = np.array(bounds, dtype=np.float64)
+        self.dimension = len(self.bounds)
+        self.bins = bins
+
+        if pairs is None:
+            pairs = itertools.combinations(range(self.dimension), 2)
+        self.pairs = tuple(self._check_pair(p) for p in pairs)
+
+        self._lower = self.bounds[:, 0]
+        self._scale = bins / (self.bounds[:, 1] - self.bounds[:, 0])
+        self._offsets_1d = np.arange(self.dimension) * bins
+
+        # Fixed-size accumulators: raw integrand sums per bin
+        self._sums_1d = np.zeros((self.dimension, bins))
+        self._sums_2d = np.zeros((len(self.pairs), bins * bins))
+        self.samples = 0
+
+    def accumulate(self, points: np.ndarray, values: np.ndarray) -> None:
+        """
+        Folds one evaluated batch into the histograms.
+        :param points: (N, D) array of sample points.
+        :param values: (N,) array of integrand values at those points.
+        """
+        idx = ((points - self._lower) * self._scale).astype(np.intp)
+        np.clip(idx, 0, self.bins - 1, out=idx)
+
+        if np.iscomplexobj(values) and not np.iscomplexobj(self._sums_1d):
+            self._sums_1d = self._sums_1d.astype(np.complex128)
+            self._sums_2d = self._sums_2d.astype(np.complex128)
+
+        # All 1D marginals in a single bincount by offsetting each axis into its own block
+        flat = (idx + self._offsets_1d).ravel()
+        weights = np.repeat(values, self.dimension)
+        self._sums_1d += self._bincount(
+            flat, weights, self.dimension * self.bins
+        ).reshape(self.dimension, self.bins)
+
+        for k, (a, b) in enumerate(self.pairs):
+            self._sums_2d[k] += self._bincount(idx[:, a] * self.bins + idx[:, b], values, self.bins * self.bins)
+
+        self.samples += len(values)
+
+    def edges(self, axis: int) -> np.ndarray:
+        """Bin edges along the given axis."""
+        return np.linspace(self.bounds[axis, 0], self.bounds[axis, 1], self.bins + 1)
+
+    def marginal_1d(self, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Estimated marginal density of the integrand along one axis.
+        Summing density * bin width recovers the integral estimate.
+        :return: (centers, density) arrays of length `bins`.
+        """
+        edges = self.edges(axis)
+        bin_width = edges[1] - edges[0]
+        density = self._sums_1d[axis] * self._volume() / (max(self.samples, 1) * bin_width)
+        return 0.5 * (edges[:-1] + edges[1:]), density
+
+    def marginal_2d(self, pair: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Estimated marginal density of the integrand over an axis pair.
+        :return: (x_centers, y_centers, density) with density shaped (bins, bins),
+                 indexed as density[x_bin, y_bin].
+        """
+        k = self._pair_index(pair)
+        a, b = self.pairs[k]
+        edges_a, edges_b = self.edges(a), self.edges(b)
+        bin_area = (edges_a[1] - edges_a[0]) * (edges_b[1] - edges_b[0])
+        density = self._sums_2d[k].reshape(self.bins, self.bins) * self._volume() / (max(self.samples, 1) * bin_area)
+        if (a, b) != tuple(pair):
+            density = density.T
+            edges_a, edges_b = edges_b, edges_a
+        return 0.5 * (edges_a[:-1] + edges_a[1:]), 0.5 * (edges_b[:-1] + edges_b[1:]), density
+
+    def surface(self, pair: Tuple[int, int] = (0, 1)) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Wraps a 2D marginal as a vectorized function of (N, 2) points,
+        compatible with the 2D renderers.
+        """
+        _, _, density = self.marginal_2d(pair)
+        lower = self._lower[list(pair)]
+        scale = self._scale[list(pair)]
+
+        def projected(points: np.ndarray) -> np.ndarray:
+            idx = ((np.atleast_2d(points) - lower) * scale).astype(np.intp)
+            np.clip(idx, 0, self.bins - 1, out=idx)
+            return density[idx[:, 0], idx[:, 1]]
+
+        return projected
+
+    def render_view(self,
+                    bounds: List[Tuple[float, float]],
+                    pair: Tuple[int, int] = (0, 1)) -> Tuple[Callable[[np.ndarray], np.ndarray], List[List[float]]]:
+        """
+        Validated 2D stand-in for a D > 2 integrand, as used by the renderers.
+        :param bounds: The integration bounds the renderer was given.
+        :return: (surface function over `pair`, bounds of the two axes)
+        """
+        if len(bounds) <= 2:
+            raise VisiontegralError(f"Marginal rendering is for D > 2; got {len(bounds)}D bounds.")
+        if len(bounds) != self.dimension:
+            raise VisiontegralError(
+                f"Projector covers {self.dimension}D but the bounds are {len(bounds)}D."
+            )
+        return self.surface(pair), self.bounds[list(pair)].tolist()
+
+    @staticmethod
+    def _bincount(flat: np.ndarray, weights: np.ndarray, length: int) -> np.ndarray:
+        """np.bincount only takes real weights; complex ones are binned per component."""
+        if np.iscomplexobj(weights):
+            return (np.bincount(flat, weights=weights.real, minlength=length)
+                    + 1j * np.bincount(flat, weights=weights.imag, minlength=length))
+        return np.bincount(flat, weights=weights, minlength=length)
+
+    def _check_pair(self, pair: Tuple[int, int]) -> Tuple[int, int]:
+        pair = tuple(pair)
+        if len(pair) != 2 or pair[0] == pair[1] or not all(0 <= a < self.dimension for a in pair):
+            raise VisiontegralError(f"Pair must be two distinct axes in [0, {self.dimension}); got {pair}.")
+        return pair
+
+    def _pair_index(self, pair: Tuple[int, int]) -> int:
+        pair = self._check_pair(pair)
+        for k, p in enumerate(self.pairs):
+            if p == pair or p == pair[::-1]:
+                return k
+        raise VisiontegralError(f"Pair {pair} was not projected. Available: {list(self.pairs)}")
+
+    def _volume(self) -> float:
+        return float(np.prod(self.bounds[:, 1] - self.bounds[:, 0]))
@@ -0,0 +1,217 @@
+"""
+selection.py - Automatic Solver Selection
+Author: Visionis
+Description: Cheap batched probing of an integrand and a cost model that
+             picks the most suitable registered solver for method="auto".
+"""
+
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Union
+from .engine import BaseIntegrator, VisiontegralError
+from .quadratures import AdaptiveQuadratureSolver
+
+@dataclass(frozen=True)
+class ProbeReport:
+    """Integrand characteristics measured by a single probe pass."""
+    dimension: int
+    mean: Union[float, complex]
+    std: float
+    discontinuity: float          # Fraction of short steps whose jump survives step refinement
+    piecewise_constant: bool      # A few (but more than one) distinct values, e.g. indicators
+    endpoint_singular: bool       # Growth or non-finite values approaching a face
+    batch_eval_time: float        # Seconds per point in a vectorized call
+    single_eval_time: float       # Seconds per one-point call (nquad style)
+    evaluations: int
+
+    @property
+    def is_discontinuous(self) -> bool:
+        return self.piecewise_constant or self.discontinuity > 0.0
+
+class MethodSelector:
+    """
+    Probes the integrand once, then estimates the wall time of each registered
+    solver and picks the cheapest one expected to meet the tolerance.
+    """
+    # Rough evaluation counts per axis for smooth integrands
+    _NQUAD_EVALS_PER_AXIS = 63
+    # nquad makes one Python call per node; beyond this it is never a sensible choice
+    _NQUAD_MAX_EVALS = 1_000_000
+    # Level at which tanh-sinh typically converges (~74 nodes per [0, 1] axis)
+    _TANH_SINH_LEVEL = 3
+    # Relative accuracy asked for when the caller gives no tolerance
+    DEFAULT_RTOL = 1e-6
+    # Relative accuracy below which double-precision quadrature cannot be relied on to converge
+    _QUADRATURE_RTOL_FLOOR = 1e-14
+
+    def __init__(self, probe_samples: int = 2048, probe_pairs: int = 512,
+                 jump_threshold: float = 0.25, jump_step: float = 0.05, refinements: int = 12,
+                 seed: int = 0):
+        self.probe_samples = probe_samples
+        self.probe_pairs = probe_pairs
+        self.jump_threshold = jump_threshold
+        self.jump_step = jump_step      # Initial step, as a fraction of each axis width
+        self.refinements = refinements  # Bisections applied to a suspected jump
+        self.seed = seed
+
+    def probe(self, func: Callable, bounds: np.ndarray) -> ProbeReport:
+        """Evaluates func on a few thousand points in a handful of batched calls plus a timing call."""
+        rng = np.random.default_rng(self.seed)
+        dim = len(bounds)
+        lower, width = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+
+        # 1. Variance and per-point cost from a plain uniform batch
+        points = lower + width * rng.random((self.probe_samples, dim))
+        start_t = time.perf_counter()
+        values = self._evaluate(func, points)
+        batch_eval_time = (time.perf_counter() - start_t) / self.probe_samples
+
+        finite = values[np.isfinite(values)]
+        mean = np.mean(finite).item() if finite.size else 0.0
+        std = float(np.std(finite)) if finite.size else 0.0
+        scale = std + abs(mean) + 1e-300
+        # A constant integrand has a single value and is perfectly smooth
+        distinct = np.unique(finite).size
+        piecewise_constant = 2 <= distinct <= max(2, self.probe_samples // 100)
+
+        # 2. Jumps across short random steps, kept off the faces so endpoint growth is not mistaken for a jump
+        base = lower + width * rng.uniform(0.1, 0.9, (self.probe_pairs, dim))
+        direction = rng.standard_normal((self.probe_pairs, dim))
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+        stepped = np.clip(base + self.jump_step * width * direction, lower, bounds[:, 1])
+        discontinuity, refine_evals = self._confirm_jumps(func, base, stepped, self.jump_threshold * scale)
+
+        # 3. Growth towards each face: compare distances 1e-6 and 1e-12 of the width
+        endpoint_singular = self._probe_faces(func, bounds, rng, scale)
+
+        # 4. One-point call overhead, which dominates nquad's cost
+        start_t = time.perf_counter()
+        for p in points[:3]:
+            func(p.reshape(1, -1))
+        single_eval_time = (time.perf_counter() - start_t) / 3
+
+        return ProbeReport(
+            dimension=dim,
+            mean=mean,
+            std=std,
+            discontinuity=discontinuity,
+            piecewise_constant=bool(piecewise_constant),
+            endpoint_singular=endpoint_singular,
+            batch_eval_time=batch_eval_time,
+            single_eval_time=single_eval_time,
+            evaluations=self.probe_samples + 2 * self.probe_pairs + refine_evals + 4 * dim * 16 + 3
+        )
+
+    def select(self,
+               report: ProbeReport,
+               solvers: Dict[str, BaseIntegrator],
+               bounds: np.ndarray,
+               tolerance: Optional[float] = None,
+               time_budget: Optional[float] = None) -> Tuple[str, str]:
+        """
+        Chooses among the registered solvers. Without a tolerance, a relative
+        tolerance of DEFAULT_RTOL is used so that accuracy, not only speed,
+        decides between sampling and deterministic rules.
+        :return: (method name, human-readable reason)
+        """
+        volume = float(np.prod(bounds[:, 1] - bounds[:, 0]))
+        target = tolerance
+        if target is None:
+            target = self.DEFAULT_RTOL * volume * (abs(report.mean) or report.std or 1.0)
+
+        estimates = {}   # name -> (seconds, meets tolerance)
+
+        if "monte_carlo" in solvers:
+            samples = getattr(solvers["monte_carlo"], "samples", 1_000_000)
+            mc_error = volume * report.std / np.sqrt(samples)
+            estimates["monte_carlo"] = (samples * report.batch_eval_time, mc_error <= target)
+
+        # Deterministic rules lose their convergence order on discontinuities; they
+        # receive the tolerance as epsabs and reach it unless it is below rounding level
+        if not report.is_discontinuous:
+            reachable = target >= self._QUADRATURE_RTOL_FLOOR * volume * (abs(report.mean) or report.std)
+            evals = self._NQUAD_EVALS_PER_AXIS ** report.dimension
+            if "quadrature" in solvers and not report.endpoint_singular and evals <= self._NQUAD_MAX_EVALS:
+                estimates["quadrature"] = (evals * report.single_eval_time, reachable)
+            if "tanh_sinh" in solvers:
+                # Real grid size at the typical convergence level; over-budget grids are not an option at all
+                evals = np.prod([len(AdaptiveQuadratureSolver._tanh_sinh_axis(self._TANH_SINH_LEVEL, lo, hi)[0])
+                                 for lo, hi in bounds], dtype=float)
+                if evals <= getattr(solvers["tanh_sinh"], "max_evals", np.inf):
+                    estimates["tanh_sinh"] = (evals * report.batch_eval_time, reachable)
+
+        if not estimates:
+            raise VisiontegralError(f"No registered solver is suitable. Available: {list(solvers.keys())}")
+
+        traits = self._describe(report)
+        feasible = {k: v for k, v in estimates.items()
+                    if v[1] and (time_budget is None or v[0] <= time_budget)}
+        pool = feasible or estimates
+        method = min(pool, key=lambda k: pool[k][0])
+
+        reason = f"{report.dimension}D, {traits}; estimated {pool[method][0]:.3g}s"
+        if not feasible and (tolerance is not None or time_budget is not None):
+            reason += " (no solver met the tolerance/time budget; picked the cheapest)"
+        return method, reason
+
+    def _confirm_jumps(self, func: Callable, a: np.ndarray, b: np.ndarray, threshold: float) -> Tuple[float, int]:
+        """
+        Flags steps whose difference exceeds `threshold`, then bisects them towards
+        the larger half-difference. A smooth difference shrinks with the step
+        (by 2^-refinements overall); a real jump does not.
+        :return: (fraction of all steps that are confirmed jumps, evaluations used)
+        """
+        values = self._evaluate(func, np.concatenate([a, b]))
+        fa, fb = values[:len(a)], values[len(a):]
+        suspect = np.abs(fb - fa) > threshold
+        a, b, fa, fb = a[suspect], b[suspect], fa[suspect], fb[suspect]
+        evaluations = 0
+
+        for _ in range(self.refinements):
+            if not len(a):
+                break
+            mid = 0.5 * (a + b)
+            fm = self._evaluate(func, mid)
+            evaluations += len(mid)
+            left = np.abs(fm - fa) >= np.abs(fb - fm)
+            b, fb = np.where(left[:, None], mid, b), np.where(left, fm, fb)
+            a, fa = np.where(left[:, None], a, mid), np.where(left, fa, fm)
+
+        confirmed = np.count_nonzero(np.abs(fb - fa) > threshold)
+        return confirmed / self.probe_pairs, evaluations
+
+    def _probe_faces(self, func: Callable, bounds: np.ndarray, rng: np.random.Generator, scale: float) -> bool:
+        dim = len(bounds)
+        lower, upper, width = bounds[:, 0], bounds[:, 1], bounds[:, 1] - bounds[:, 0]
+        anchors = lower + width * rng.random((16, dim))
+
+        batches = []
+        for axis in range(dim):
+            for offset in (1e-6, 1e-12):
+                for face, sign in ((lower[axis], 1.0), (upper[axis], -1.0)):
+                    pts = anchors.copy()
+                    pts[:, axis] = face + sign * offset * width[axis]
+                    batches.append(pts)
+        values = self._evaluate(func, np.concatenate(batches)).reshape(dim, 2, 2, 16)
+
+        if not np.all(np.isfinite(values)):
+            return True
+        far, near = np.abs(values[:, 0]), np.abs(values[:, 1])
+        return bool(np.any(near > 1.5 * far + 1e-8 * scale))
+
+    @staticmethod
+    def _evaluate(func: Callable, points: np.ndarray) -> np.ndarray:
+        try:
+            with np.errstate(all='ignore'):
+                return np.asarray(func(points))
+        except Exception as e:
+            raise VisiontegralError(f"Function evaluation failed during method probe: {e}")
+
+    @staticmethod
+    def _describe(report: ProbeReport) -> str:
+        if report.is_discontinuous:
+            return "discontinuous integrand"
+        if report.endpoint_singular:
+            return "endpoint singularity detected"
+        return "smooth integrand"
@@ -0,0 +1,293 @@
+"""
+distributed.py - Multi-Node Batch Scheduler
+Author: Visionis
+Description: Coordinator/worker Monte Carlo over TCP. The coordinator hands out
+             (seed-stream, sample-count) work units, workers stream back compact
+             partial statistics, and the coordinator merges them into one result.
+
+Security: messages are pickled (the integrand itself is shipped to workers),
+and unpickling runs arbitrary code. The HMAC handshake of
+multiprocessing.connection with a secret authkey is the only protection, so
+keep the key secret and only expose the port on trusted networks.
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from core.engine import IntegrationResult, VisiontegralError
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PartialStats:
+    """Sufficient statistics of one work unit; merging is plain addition."""
+    count: int
+    total: Union[float, complex]
+    sq_total: float
+
+@dataclass
+class _Job:
+    """State of one distributed run, guarded by the coordinator's condition."""
+    job_id: int
+    payload: bytes                                   # Pickled (func, bounds, batch_size, seed)
+    pending: List[Tuple[int, int]]                   # [(unit_id, samples), ...] not yet handed out
+    n_units: int
+    partials: Dict[int, PartialStats] = field(default_factory=dict)
+    error: Optional[str] = None
+    dispatched: bool = False                         # A worker has taken at least one unit
+
+def sample_unit(func: Callable, bounds: np.ndarray, samples: int,
+                batch_size: int, seed: int, unit_id: int) -> PartialStats:
+    """
+    Evaluates one work unit. The random stream depends only on (seed, unit_id),
+    so the merged result is independent of which worker ran which unit.
+    """
+    rng = np.random.default_rng([seed, unit_id])
+    dim = len(bounds)
+    total = 0.0
+    sq_total = 0.0
+    processed = 0
+
+    while processed < samples:
+        current_batch = min(batch_size, samples - processed)
+        points = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * rng.random((current_batch, dim))
+        values = np.nan_to_num(func(points))
+        total += np.sum(values)
+        sq_total += np.sum(np.abs(values) ** 2)
+        processed += current_batch
+
+    return PartialStats(count=processed, total=complex(total) if np.iscomplexobj(total) else float(total), sq_total=float(sq_total))
+
+class BatchCoordinator:
+    """
+    Accepts worker connections and schedules work units on a pull basis:
+    an idle worker takes the next unit, so fast nodes simply do more of them.
+    Units held by a worker that disconnects or times out are re-queued.
+
+    If no authkey is given, a random one is generated; pass `coordinator.authkey`
+    to the workers out of band.
+    """
+    def __init__(self,
+                 address: Tuple[str, int] = ("127.0.0.1", 0),
+                 authkey: Optional[bytes] = None,
+                 unit_timeout: Optional[float] = None):
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        self.unit_timeout = unit_timeout
+
+        self._cond = threading.Condition()
+        self._job: Optional[_Job] = None
+        self._job_counter = 0
+        self._closed = False
+        self.workers = 0
+
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def run(self,
+            func: Callable,
+            bounds: List[Tuple[float, float]],
+            samples: int = 10_000_000,
+            unit_samples: int = 1_000_000,
+            batch_size: int = 500_000,
+            seed: int = 0,
+            timeout: Optional[float] = None) -> IntegrationResult:
+        """
+        Distributes a Monte Carlo integration over the connected workers.
+        `func` must be picklable (e.g. a module-level function) and importable
+        on the workers. The run waits for the first worker to connect, but
+        fails once every worker that joined it has dropped out.
+        """
+        if samples <= 0 or unit_samples <= 0:
+            raise VisiontegralError(
+                f"samples and unit_samples must be positive, got {samples} and {unit_samples}."
+            )
+        bounds_arr = np.array(bounds, dtype=np.float64)
+        try:
+            payload = pickle.dumps((func, bounds_arr, batch_size, seed))
+        except Exception as e:
+            raise VisiontegralError(f"Integrand must be picklable to ship to workers: {e}")
+
+        sizes = [unit_samples] * (samples // unit_samples)
+        if samples % unit_samples:
+            sizes.append(samples % unit_samples)
+
+        start_t = time.perf_counter()
+        with self._cond:
+            if self._job is not None:
+                raise VisiontegralError("A distributed run is already in progress.")
+            self._job_counter += 1
+            job = _Job(
+                job_id=self._job_counter,
+                payload=payload,
+                pending=list(enumerate(sizes)),
+                n_units=len(sizes)
+            )
+            self._job = job
+            self._cond.notify_all()
+
+            finished = self._cond.wait_for(
+                lambda: (len(job.partials) == job.n_units or job.error is not None or self._closed
+                         or (job.dispatched and self.workers == 0)),
+                timeout
+            )
+            self._job = None
+            if job.error is not None:
+                raise VisiontegralError(job.error)
+            if finished and self.workers == 0 and len(job.partials) < job.n_units:
+                raise VisiontegralError(
+                    f"All workers dropped out: {len(job.partials)}/{job.n_units} units finished."
+                )
+            if not finished or self._closed:
+                raise VisiontegralError(
+                    f"Distributed run incomplete: {len(job.partials)}/{job.n_units} units finished."
+                )
+
+        # Merge in unit order so the floating-point result does not depend on scheduling
+        merged = [job.partials[uid] for uid in range(job.n_units)]
+        count = sum(p.count for p in merged)
+        mean = sum(p.total for p in merged) / count
+        variance = sum(p.sq_total for p in merged) / count - abs(mean) ** 2
+        volume = np.prod(bounds_arr[:, 1] - bounds_arr[:, 0])
+
+        return IntegrationResult(
+            value=volume * mean,
+            error_estimate=volume * np.sqrt(max(variance, 0.0) / count),
+            dimension=len(bounds_arr),
+            samples=count,
+            execution_time=time.perf_counter() - start_t,
+            method="distributed_monte_carlo"
+        )
+
+    def close(self) -> None:
+        """Stops scheduling; connected workers receive a stop message."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._listener.close()
+
+    def __enter__(self) -> "BatchCoordinator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Connection handling ---
+
+    def _accept_loop(self) -> None:
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._closed:
+                    return
+                logger.warning("Rejected a worker connection (handshake failed).")
+                continue
+            with self._cond:
+                self.workers += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _next_unit(self) -> Tuple[Optional[_Job], Optional[Tuple[int, int]]]:
+        """Blocks until a unit is available; returns (None, None) on shutdown."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed or (self._job is not None and self._job.pending))
+            if self._closed:
+                return None, None
+            self._job.dispatched = True
+            return self._job, self._job.pending.pop(0)
+
+    def _serve(self, conn: Connection) -> None:
+        sent_job = None
+        job, unit = None, None
+        try:
+            while True:
+                job, unit = self._next_unit()
+                if job is None:
+                    conn.send(("stop",))
+                    return
+                if sent_job != job.job_id:
+                    conn.send(("job", job.job_id, job.payload))
+                    sent_job = job.job_id
+
+                unit_id, samples = unit
+                conn.send(("unit", unit_id, samples))
+                if self.unit_timeout is not None and not conn.poll(self.unit_timeout):
+                    raise TimeoutError(f"unit {unit_id} timed out")
+
+                # Integrand errors are deterministic, so they fail the run instead of re-queuing
+                kind, reply_id, body = conn.recv()
+                with self._cond:
+                    if kind == "error":
+                        job.error = body
+                    else:
+                        job.partials[reply_id] = body
+                    self._cond.notify_all()
+                job, unit = None, None
+        except (EOFError, OSError, TimeoutError) as e:
+            logger.warning(f"Worker dropped ({type(e).__name__}: {e}); re-queuing its unit.")
+        finally:
+            with self._cond:
+                self.workers -= 1
+                if job is not None and unit is not None and job is self._job:
+                    job.pending.insert(0, unit)
+                self._cond.notify_all()
+            conn.close()
+
+def run_worker(address: Tuple[str, int], authkey: bytes) -> int:
+    """
+    Connects to a coordinator and processes work units until told to stop.
+    The coordinator's messages are unpickled, so only connect to trusted ones.
+    :return: Number of units processed.
+    """
+    conn = Client(address, authkey=authkey)
+    payload, load_error = None, None
+    processed = 0
+    try:
+        while True:
+            message = conn.recv()
+            if message[0] == "stop":
+                return processed
+            if message[0] == "job":
+                # The job arrives as bytes so a missing integrand (e.g. defined in the
+                # coordinator's __main__) fails the run instead of killing this worker
+                try:
+                    payload, load_error = pickle.loads(message[2]), None
+                except Exception as e:
+                    payload, load_error = None, f"Could not load the integrand on worker: {e}"
+                continue
+
+            _, unit_id, samples = message
+            if load_error is not None:
+                conn.send(("error", unit_id, load_error))
+                continue
+            func, bounds, batch_size, seed = payload
+            try:
+                stats = sample_unit(func, bounds, samples, batch_size, seed, unit_id)
+            except Exception as e:
+                conn.send(("error", unit_id, f"Function evaluation failed on worker: {e}"))
+                continue
+            conn.send(("partial", unit_id, stats))
+            processed += 1
+    except EOFError:
+        return processed
+    finally:
+        conn.close()
+
+def spawn_local_workers(address: Tuple[str, int],
+                        count: int,
+                        authkey: bytes) -> List[multiprocessing.Process]:
+    """Starts `count` worker processes on this machine, e.g. for testing."""
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(address, authkey), daemon=True)
+        for _ in range(count)
+    ]
+    for w in workers:
+        w.start()
+    return workers
@@ -6,7 +6,7 @@ Description: Multi-core distribution for intensive integration tasks.
 
 import concurrent.futures
 import numpy as np
-from typing import Callable, List, Tuple
+from typing import Any, Callable, List, Tuple
 
 class ParallelCompute:
     """Manages high-throughput parallel execution for Monte Carlo sampling."""
@@ -18,10 +18,12 @@ class ParallelCompute:
         """
         Executes tasks across multiple CPU cores using ProcessPoolExecutor.
         Avoids GIL (Global Interpreter Lock) for heavy math operations.
+        For multi-node runs, see utils.distributed.BatchCoordinator.
         """
         with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
             futures = [executor.submit(task, *args) for args in args_list]
-            return [f.result() for f in concurrent.futures.as_completed(futures)]
+            # Results are returned in submission order so they line up with args_list
+            return [f.result() for f in futures]
 
     @staticmethod
     def chunk_samples(total_samples: int, cpu_count: int) -> List[int]:
@@ -16,6 +16,7 @@ from typing import Callable, List, Optional, Tuple, Union
 # Third-party libraries (Graceful degradation check could be added here)
 from manim import *
 from core.engine import IntegrationResult
+from core.projections import MarginalProjector
 
 # --- Configuration Layer ---
 
@@ -85,15 +86,26 @@ class VisiontegralScene(ThreeDScene):
     def visualize_integration(self, 
                             func: Callable[[np.ndarray], float], 
                             bounds: List[Tuple[float, float]], 
-                            result: IntegrationResult):
+                            result: IntegrationResult,
+                            projector: Optional[MarginalProjector] = None,
+                            pair: Tuple[int, int] = (0, 1)):
         """
         Main orchestration method for generating the integration movie.
+        For D > 2, the marginal accumulated by `projector` over `pair` is rendered.
         """
         self.logger.info("Starting visualization render sequence...")
 
-        if len(bounds) != 2:
+        if len(bounds) > 2 and projector is not None:
+            self.logger.info(f"Rendering streamed marginal over axes {pair} of {len(bounds)}D space.")
+            func, bounds = projector.render_view(bounds, pair)
+        elif len(bounds) != 2:
             self.logger.warning("Visualizer currently optimizes 2D -> 1D projections. Higher dims will be sliced.")
-            # Future-proof: Logic for slicing higher dimensions could go here.
+
+        # Complex integrands are shown as their modulus surface
+        raw_func = func
+        def func(points: np.ndarray) -> np.ndarray:
+            values = raw_func(points)
+            return np.abs(values) if np.iscomplexobj(values) else values
 
         # 1. Setup Axes (The Stage)
         x_min, x_max = bounds[0]
@@ -6,8 +6,9 @@ Description: WebGL-based visualization for real-time manifold exploration.
 
 import plotly.graph_objects as go
 import numpy as np
-from typing import Callable, List, Tuple
-from core.engine import IntegrationResult
+from typing import Callable, List, Optional, Tuple
+from core.engine import IntegrationResult, VisiontegralError
+from core.projections import MarginalProjector
 
 class ManifoldExplorer:
     """Scientific visualization suite for interactive data exploration."""
@@ -19,10 +20,21 @@ class ManifoldExplorer:
                        func: Callable[[np.ndarray], np.ndarray], 
                        bounds: List[Tuple[float, float]], 
                        result: IntegrationResult,
-                       resolution: int = 150) -> None:
+                       resolution: int = 150,
+                       projector: Optional[MarginalProjector] = None,
+                       pair: Tuple[int, int] = (0, 1)) -> None:
         """
         Renders a fully interactive WebGL surface with adaptive mesh.
+        For D > 2, pass the projector filled during the solver run to render
+        the marginal over `pair` instead of re-sampling the integrand.
         """
+        if len(bounds) > 2:
+            if projector is None:
+                raise VisiontegralError("Rendering more than 2 dimensions requires a MarginalProjector.")
+            func, bounds = projector.render_view(bounds, pair)
+        elif len(bounds) != 2:
+            raise VisiontegralError(f"Surface rendering needs 2D bounds (or D > 2 with a projector); got {len(bounds)}D.")
+
         # Generate high-resolution coordinate grid
         x_lin = np.linspace(bounds[0][0], bounds[0][1], resolution)
         y_lin = np.linspace(bounds[1][0], bounds[1][1], resolution)
@@ -31,6 +43,8 @@ class ManifoldExplorer:
         # Flatten for vectorized computation
         points = np.stack([x_grid.ravel(), y_grid.ravel()], axis=1)
         z_values = func(points).reshape(resolution, resolution)
+        if np.iscomplexobj(z_values):
+            z_values = np.abs(z_values)  # Complex integrands are shown as their modulus surface
 
         fig = go.Figure()
 